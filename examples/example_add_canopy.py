@@ -2,13 +2,6 @@
 Example script demonstrating how to combine canopies using the addition operator.
 """
 
-import sys
-from pathlib import Path
-
-# Add the project root directory to the Python path
-project_root = Path(__file__).parent.parent
-sys.path.append(str(project_root))
-
 from src.io.make_medium import make_canopy, create_uniform_canopy
 
 # Create two different canopies
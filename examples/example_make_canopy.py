@@ -2,13 +2,6 @@
 Example script demonstrating how to create and manipulate canopy layers.
 """
 
-import sys
-from pathlib import Path
-
-# Add the project root directory to the Python path
-project_root = Path(__file__).parent.parent
-sys.path.append(str(project_root))
-
 from src.io.make_medium import make_layer, make_canopy, create_uniform_canopy
 
 # Create a sample canopy with multiple layers
@@ -9,6 +9,9 @@ setup(
         "scipy>=1.7.0",
         "matplotlib>=3.4.0",
     ],
+    extras_require={
+        "jit": ["numba>=0.56"],
+    },
     author="Jiheng Hu",
     author_email="hjh18305@gmail.com",
     description="Canopy Microwave Radiative Transfer model",
@@ -0,0 +1,3 @@
+"""
+CanORT (Canopy Optical Radiative Transfer) model.
+"""
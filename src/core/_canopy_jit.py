@@ -0,0 +1,26 @@
+"""
+numba-compiled versions of the reductions in _canopy_kernels.
+
+Importing this module imports numba, so it is only loaded on the first
+kernel call, never as a side effect of importing the package.
+"""
+
+from numba import njit
+
+from .layer import leaf_masses
+
+
+# Per-layer mass formulas shared with Layer and the NumPy kernels
+_leaf_masses = njit(cache=True)(leaf_masses)
+
+
+@njit(cache=True)
+def mass_sums(wvf, dmd, lai, leaf_thickness):
+    """Total water content and above ground biomass in kg/m², from one leaf_masses pass"""
+    total_water = 0.0
+    total_biomass = 0.0
+    for i in range(wvf.shape[0]):
+        water, biomass = _leaf_masses(wvf[i], dmd[i], lai[i], leaf_thickness[i])
+        total_water += water
+        total_biomass += biomass
+    return total_water, total_biomass
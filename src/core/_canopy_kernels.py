@@ -0,0 +1,74 @@
+"""
+Reduction kernels over the per-layer arrays of a Canopy.
+
+The functions here are the NumPy implementations. For the few layers a
+canopy usually has they loop over Python floats, because the fixed
+dispatch cost of a vectorized NumPy expression outweighs its work there.
+When numba is installed, kernels() returns the compiled mass_sums from
+_canopy_jit instead. numba is imported on the first kernel call rather
+than with the package, so importing it stays fast. All sums are Python
+floats, so a zero biomass raises ZeroDivisionError whichever is in use.
+
+total, interface_heights and middle_heights have no compiled version
+and are called directly, without loading numba. A plain sum gains
+nothing from compiling, and Canopy caches the heights, so they only
+run once per change of the layers.
+"""
+
+import sys
+
+import numpy as np
+
+from .layer import leaf_masses
+
+# Module providing the kernels, resolved on first use by kernels()
+_backend = None
+
+# Below this many layers a Python loop over plain floats beats the fixed
+# dispatch cost of the vectorized NumPy expressions
+SMALL_CANOPY_LAYERS = 24
+
+
+def total(values):
+    """Sum of a per-layer array as a Python float"""
+    if values.shape[0] < SMALL_CANOPY_LAYERS:
+        return sum(values.tolist(), 0.0)
+    return float(values.sum())
+
+
+def mass_sums(wvf, dmd, lai, leaf_thickness):
+    """Total water content and above ground biomass in kg/m², from one leaf_masses pass"""
+    if wvf.shape[0] < SMALL_CANOPY_LAYERS:
+        total_water = total_biomass = 0.0
+        for layer in zip(wvf.tolist(), dmd.tolist(), lai.tolist(), leaf_thickness.tolist()):
+            water, biomass = leaf_masses(*layer)
+            total_water += water
+            total_biomass += biomass
+        return total_water, total_biomass
+    water, biomass = leaf_masses(wvf, dmd, lai, leaf_thickness)
+    return float(water.sum()), float(biomass.sum())
+
+
+def interface_heights(thickness):
+    """Height of each layer interface, 0 followed by the top of each layer"""
+    out = np.empty(thickness.shape[0] + 1)
+    out[0] = 0.0
+    np.cumsum(thickness, out=out[1:])
+    return out
+
+
+def middle_heights(thickness):
+    """Height of the middle of each layer"""
+    return np.cumsum(thickness) - thickness / 2
+
+
+def kernels():
+    """Module providing the kernels: _canopy_jit when numba is installed, else this one"""
+    global _backend
+    if _backend is None:
+        try:
+            from . import _canopy_jit as backend
+        except ImportError:
+            backend = sys.modules[__name__]
+        _backend = backend
+    return _backend
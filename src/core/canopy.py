@@ -3,14 +3,162 @@ Vegetation canopy modeling module for CanoRT.
 """
 
 import numpy as np
-from typing import Tuple, Dict, Optional, List
-from copy import deepcopy
+from typing import Tuple, Dict, Optional, List, Iterator, Union
 
-from .layer import Layer
+from .layer import Layer, leaf_masses, check_layer_ranges, copy_dielectric
+from .constants import DEFAULT_LEAF_THICKNESS, DEFAULT_WATER_VOLUMETRIC_FRACTION, DEFAULT_LAI, DEFAULT_DRY_MASS_DENSITY
+from .constants import MIN_LAYER_THICKNESS, MAX_LAYER_THICKNESS, MIN_LAI, MAX_LAI, ZERO, ONE
+from ._canopy_kernels import kernels, total, interface_heights, middle_heights
+
+# Per-layer float arrays held by a Canopy, paired with the Layer attribute each one stores;
+# their order is the row order of the canopy's storage buffer
+_FIELDS = (
+    ('_thickness', 'thickness'),
+    ('_temperature', 'temperature'),
+    ('_leaf_thickness', 'leaf_thickness'),
+    ('_wvf', 'water_volumetric_fraction'),
+    ('_lai', 'lai'),
+    ('_dmd', 'dry_mass_density'),
+)
+
+# Names of the field arrays alone, in _FIELDS order
+_FIELD_NAMES = tuple(name for name, _ in _FIELDS)
+
+# Smallest buffer allocated when a canopy grows past its current capacity
+_MIN_CAPACITY = 4
+
+# Allowed range of each field, in _FIELDS order, as columns so that all fields
+# are checked with one comparison; fields without a range are unbounded
+_LOWER_BOUNDS = np.array([[MIN_LAYER_THICKNESS], [-np.inf], [-np.inf], [ZERO], [MIN_LAI], [-np.inf]])
+_UPPER_BOUNDS = np.array([[MAX_LAYER_THICKNESS], [np.inf], [np.inf], [ONE], [MAX_LAI], [np.inf]])
+
+
+def _fill_column(column: np.ndarray, values, name: str, default: Optional[float] = None) -> None:
+    """Fill a per-layer column from `values`, a scalar repeated for every layer, or `default` when None"""
+    if values is None:
+        values = default
+    # isinstance settles the common Python floats and lists without the cost of np.ndim
+    elif isinstance(values, (list, tuple)) or (not isinstance(values, (float, int)) and np.ndim(values) != 0):
+        if len(values) != len(column):
+            raise ValueError(f"{name} must have the same length as thicknesses")
+    column[:] = values
+
+
+class LayerView:
+    """Read-only view of one layer of a Canopy, backed by the canopy's arrays."""
+    
+    # Values are returned as Python floats, matching what a Layer holds
+    __slots__ = ('_c', '_i')
+    
+    def __init__(self, canopy: 'Canopy', index: int):
+        self._c = canopy
+        self._i = index
+    
+    @property
+    def thickness(self) -> float:
+        """Layer thickness (m)"""
+        return self._c._thickness.item(self._i)
+    
+    @property
+    def temperature(self) -> float:
+        """Layer temperature (K)"""
+        return self._c._temperature.item(self._i)
+    
+    @property
+    def leaf_thickness(self) -> float:
+        """Leaf thickness (mm)"""
+        return self._c._leaf_thickness.item(self._i)
+    
+    @property
+    def water_volumetric_fraction(self) -> float:
+        """Leaf Volumetric Moisture Content (m3/m3)"""
+        return self._c._wvf.item(self._i)
+    
+    @property
+    def lai(self) -> float:
+        """Leaf Area Index (m²/m²)"""
+        return self._c._lai.item(self._i)
+    
+    @property
+    def dry_mass_density(self) -> float:
+        """Dry density of the solid material (g/cm³)"""
+        return self._c._dmd.item(self._i)
+    
+    @property
+    def dielectric_constant(self) -> Optional[complex]:
+        """Complex dielectric constant, scalar or per-frequency array"""
+        return self._c._dielectric_constants[self._i]
+    
+    def _mass_terms(self) -> Tuple[float, float]:
+        """Water content and dry biomass of this row, in kg/m²"""
+        c, i = self._c, self._i
+        return leaf_masses(c._wvf.item(i), c._dmd.item(i), c._lai.item(i), c._leaf_thickness.item(i))
+    
+    @property
+    def layer_water_content(self) -> float:
+        """Water content of the layer per unit area, in kg/m²"""
+        return self._mass_terms()[0]
+    
+    @property
+    def lfmc(self) -> float:
+        """Live fuel moisture content, in kg/kg"""
+        water, biomass = self._mass_terms()
+        return water / biomass
+    
+    @property
+    def agb(self) -> float:
+        """Above ground biomass, in kg/m²"""
+        return self._mass_terms()[1]
+    
+    def to_layer(self) -> Layer:
+        """Materialize this row as an independent Layer object."""
+        return Layer(
+            thickness=self.thickness,
+            temperature=self.temperature,
+            leaf_thickness=self.leaf_thickness,
+            water_volumetric_fraction=self.water_volumetric_fraction,
+            lai=self.lai,
+            dry_mass_density=self.dry_mass_density,
+            dielectric_constant=self.dielectric_constant
+        )
+    
+    __str__ = Layer.__str__
+
+
+class LayerList:
+    """Sequence of a canopy's layers that creates LayerView objects only on access."""
+    
+    __slots__ = ('_c',)
+    
+    def __init__(self, canopy: 'Canopy'):
+        self._c = canopy
+    
+    def __len__(self) -> int:
+        return self._c.nlayers
+    
+    def __getitem__(self, ilayer: Union[int, slice]) -> Union[LayerView, List[LayerView]]:
+        n_layers = self._c.nlayers
+        if isinstance(ilayer, slice):
+            return [LayerView(self._c, i) for i in range(*ilayer.indices(n_layers))]
+        if ilayer < 0:
+            ilayer += n_layers
+        if not 0 <= ilayer < n_layers:
+            raise IndexError("layer index out of range")
+        return LayerView(self._c, ilayer)
+    
+    def __iter__(self) -> Iterator[LayerView]:
+        return (LayerView(self._c, i) for i in range(self._c.nlayers))
 
 
 class Canopy:
-    """A vegetation canopy composed of multiple layers."""
+    """A vegetation canopy composed of multiple layers.
+    
+    Layer properties are stored as one contiguous float64 array per field
+    (structure of arrays), ordered from bottom to top. Each array is the first
+    `nlayers` columns of one row of a single 2-D buffer that grows
+    geometrically. Layers appended one at a time are queued as rows and
+    written into the buffer together when the field arrays are next read.
+    """
     
     def __init__(self, 
                  layers: Optional[List[Layer]] = None):
@@ -20,33 +168,160 @@ class Canopy:
         Args:
             layers: List of Layer objects, ordered from bottom to top
         """
-        self.layers = layers if layers is not None else []
-
+        layers = layers if layers is not None else []
+        n_layers = len(layers)
+        table = np.array([[getattr(layer, attr) for layer in layers] for _, attr in _FIELDS],
+                         dtype=np.float64).reshape(len(_FIELDS), n_layers)
+        self._store(table, [layer.dielectric_constant for layer in layers])
+    
+    @classmethod
+    def _from_table(cls, table: np.ndarray, dielectric_constants: list) -> 'Canopy':
+        """Wrap an already-built table of per-layer values in a new canopy without copying it."""
+        canopy = cls.__new__(cls)
+        canopy._store(table, dielectric_constants)
+        return canopy
+    
+    def _store(self, table: np.ndarray, dielectric_constants: list) -> None:
+        """Adopt a C-ordered table with one row per field, in _FIELDS order, as the storage buffer"""
+        self._buffer = table
+        self._pending = []
+        self._set_nlayers(table.shape[1])
+        self._dielectric_constants = dielectric_constants
+        self._invalidate_heights()
+    
+    def __getattr__(self, name: str):
+        # Only reached for the field arrays while appended layers are still queued
+        if name in _FIELD_NAMES and self.__dict__.get('_pending'):
+            self._flush_pending()
+            return self.__dict__[name]
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+    
+    def _flush_pending(self) -> None:
+        """Write the queued layers into the buffer, growing it once, and rebuild the field arrays"""
+        pending = self._pending
+        n_layers = len(self._dielectric_constants)
+        start = n_layers - len(pending)
+        buffer = self._buffer
+        if n_layers > buffer.shape[1]:
+            # Double the capacity so n appends copy O(n) values in total
+            grown = np.empty((len(_FIELDS), max(2 * buffer.shape[1], n_layers, _MIN_CAPACITY)), dtype=np.float64)
+            grown[:, :start] = buffer[:, :start]
+            self._buffer = buffer = grown
+        buffer[:, start:n_layers] = np.array(pending, dtype=np.float64).T
+        pending.clear()
+        self._set_nlayers(n_layers)
+    
+    def _set_nlayers(self, n_layers: int) -> None:
+        """Point the field arrays at the first `n_layers` columns of the buffer"""
+        (self._thickness, self._temperature, self._leaf_thickness,
+         self._wvf, self._lai, self._dmd) = self._buffer[:, :n_layers]
+    
+    def _table(self) -> np.ndarray:
+        """View of the filled part of the buffer, one row per field"""
+        # Reading nlayers first writes any queued layers into the buffer
+        n_layers = self.nlayers
+        return self._buffer[:, :n_layers]
+    
+    def _invalidate_heights(self) -> None:
+        """Drop the cached interface and middle heights after the layer arrays change"""
+        self._z = None
+        self._middle_heights = None
+    
+    @classmethod
+    def from_arrays(cls,
+                    thicknesses: np.ndarray,
+                    temperatures: Union[np.ndarray, float],
+                    leaf_thicknesses: Union[np.ndarray, float, None] = None,
+                    water_volumetric_fractions: Union[np.ndarray, float, None] = None,
+                    lais: Union[np.ndarray, float, None] = None,
+                    dry_mass_densities: Union[np.ndarray, float, None] = None,
+                    dielectric_constants: Optional[List[complex]] = None) -> 'Canopy':
+        """
+        Create a canopy directly from per-layer arrays, without building Layer objects.
+        
+        Each array is copied once into the canopy and all parameters are
+        validated together with one vectorized range check. A scalar
+        applies to every layer and is filled in directly; omitted parameters
+        take the Layer defaults.
+        
+        Args:
+            thicknesses: Layer thicknesses (m), ordered from bottom to top
+            temperatures: Layer temperatures (K)
+            leaf_thicknesses: Leaf thicknesses (mm)
+            water_volumetric_fractions: Water volumetric fractions (m3/m3)
+            lais: Leaf area indices (m²/m²)
+            dry_mass_densities: Dry mass densities (g/cm³)
+            dielectric_constants: Complex dielectric constants
+        
+        Returns:
+            Canopy: A canopy object with the specified layers
+        
+        Raises:
+            ValueError: If the arrays differ in length or a value is out of range
+        """
+        n_layers = len(thicknesses)
+        # One table holds every field, its rows become the field arrays
+        table = np.empty((len(_FIELDS), n_layers), dtype=np.float64)
+        fields = {name: table[i] for i, (name, _) in enumerate(_FIELDS)}
+        _fill_column(fields['_thickness'], thicknesses, "thicknesses")
+        _fill_column(fields['_temperature'], temperatures, "temperatures")
+        _fill_column(fields['_leaf_thickness'], leaf_thicknesses, "leaf_thicknesses", DEFAULT_LEAF_THICKNESS)
+        _fill_column(fields['_wvf'], water_volumetric_fractions, "water_volumetric_fractions", DEFAULT_WATER_VOLUMETRIC_FRACTION)
+        _fill_column(fields['_lai'], lais, "lais", DEFAULT_LAI)
+        _fill_column(fields['_dmd'], dry_mass_densities, "dry_mass_densities", DEFAULT_DRY_MASS_DENSITY)
+        if dielectric_constants is None:
+            dielectric_constants = [None] * n_layers
+        elif len(dielectric_constants) != n_layers:
+            raise ValueError("dielectric_constants must have the same length as thicknesses")
+        
+        # count_nonzero is cheaper than .any() on the few layers of a typical canopy
+        if np.count_nonzero(table < _LOWER_BOUNDS) or np.count_nonzero(table > _UPPER_BOUNDS):
+            # Only reached for invalid input; reports which parameter is out of range
+            check_layer_ranges(fields['_thickness'], fields['_lai'], fields['_wvf'])
+        return cls._from_table(table, list(dielectric_constants))
+    
+    @property
+    def layers(self) -> LayerList:
+        """views of the layers, ordered from bottom to top"""
+        return LayerList(self)
+    
+    def __getitem__(self, ilayer: Union[int, slice]) -> Union[LayerView, List[LayerView]]:
+        """View of layer `ilayer`, counted from the bottom"""
+        return LayerList(self)[ilayer]
+    
     @property
     def nlayers(self) -> int:
         """number of layers"""
-        return len(self.layers)
+        return len(self._thickness)
     
     @property
     def thickness(self) -> float:
         """total thickness of the canopy"""
-        return sum(layer.thickness for layer in self.layers)
+        return total(self._thickness)
     
     @property
     def layer_thicknesses(self) -> np.ndarray:
         """thicknesses of the layers"""
-        return np.array([layer.thickness for layer in self.layers])
+        return self._thickness.copy()
     
     @property
     def layer_top_heights(self) -> np.ndarray:
         """Get the height of the top of each layer, ordered from bottom to top."""
-        return np.cumsum(self.layer_thicknesses)
+        return self.z[1:]
     
     @property
     def z(self) -> np.ndarray:
-        """height of each interface, that is, 0 and the heights of the top of each layer"""
-        return np.insert(self.layer_top_heights, 0, 0)
-
+        """height of each interface, that is, 0 and the heights of the top of each layer
+        
+        Note:
+            The array is cached until the layers change and is read-only.
+        """
+        if self._z is None:
+            z = interface_heights(self._thickness)
+            z.flags.writeable = False
+            self._z = z
+        return self._z
+    
     @property
     def layer_bottom_heights(self) -> np.ndarray:
         """height of the bottom of each layer, i.e., 0 to the n-1 layer"""
@@ -54,44 +329,57 @@ class Canopy:
     
     @property
     def layer_middle_heights(self) -> np.ndarray:
-        """height of the middle of each layer, i.e., the average of the top and bottom heights"""
-        return (self.layer_top_heights + self.layer_bottom_heights) / 2
+        """height of the middle of each layer, i.e., the average of the top and bottom heights
+        
+        Note:
+            The array is cached until the layers change and is read-only.
+        """
+        if self._middle_heights is None:
+            middle = middle_heights(self._thickness)
+            middle.flags.writeable = False
+            self._middle_heights = middle
+        return self._middle_heights
     
     @property
     def layer_lais(self) -> np.ndarray:
         """leaf area index of each layer"""
-        return np.array([layer.lai for layer in self.layers])
+        return self._lai.copy()
     
     @property
     def LAI(self) -> float:
         """total leaf area of the canopy"""
-        return sum(layer.lai for layer in self.layers)
+        return total(self._lai)
     
     @property
     def layer_temperatures(self) -> np.ndarray:
         """temperature of each layer"""
-        return np.array([layer.temperature for layer in self.layers])
+        return self._temperature.copy()
     
     @property
     def layer_leaf_moisture_content(self) -> np.ndarray:
         """leaf volumetric moisture content of each layer in m3/m3"""
-        return np.array([layer.water_volumetric_fraction for layer in self.layers])
+        return self._wvf.copy()
     
     @property
     def total_agb(self) -> float:
         """above ground biomass in kg/m²"""
-        return sum(layer.agb for layer in self.layers)
+        return kernels().mass_sums(self._wvf, self._dmd, self._lai, self._leaf_thickness)[1]
     
     @property
     def total_vwc(self) -> float:
         """total water content in kg/m²"""
-        return sum(layer.layer_water_content for layer in self.layers)
+        return kernels().mass_sums(self._wvf, self._dmd, self._lai, self._leaf_thickness)[0]
     
     @property
     def mean_lfmc(self) -> float:
         """mean live fuel moisture content in kg/kg"""
-        return self.total_vwc / self.total_agb
-
+        total_vwc, total_agb = kernels().mass_sums(self._wvf, self._dmd, self._lai, self._leaf_thickness)
+        return total_vwc / total_agb
+    
+    def _per_layer_masses(self) -> Tuple[np.ndarray, np.ndarray]:
+        """water content and dry biomass of each layer in kg/m², from one fused pass"""
+        return leaf_masses(self._wvf, self._dmd, self._lai, self._leaf_thickness)
+    
     def append_layer(self, layer: Layer) -> None:
         """
         Add a new layer to the top of the canopy.
@@ -99,16 +387,33 @@ class Canopy:
         Note:
             Layers are added to the top of the canopy (highest position).
         """
-        self.layers.append(layer)
-
+        pending = self._pending
+        if not pending:
+            # The field arrays are rebuilt, with the queued rows, on their next read
+            fields = self.__dict__
+            for name in _FIELD_NAMES:
+                del fields[name]
+            self._invalidate_heights()
+        pending.append((layer.thickness, layer.temperature, layer.leaf_thickness,
+                        layer.water_volumetric_fraction, layer.lai, layer.dry_mass_density))
+        self._dielectric_constants.append(layer.dielectric_constant)
+    
     def delete_layer(self, ilayer: int) -> None:
         """Delete a layer
         
         Args:
             ilayer: index of the layer to delete
         """
-        self.layers.pop(ilayer)
-
+        n_layers = self.nlayers
+        self._dielectric_constants.pop(ilayer)
+        if ilayer < 0:
+            ilayer += n_layers
+        # Shift the layers above down by one, in place
+        buffer = self._buffer
+        buffer[:, ilayer:n_layers - 1] = buffer[:, ilayer + 1:n_layers]
+        self._set_nlayers(n_layers - 1)
+        self._invalidate_heights()
+    
     def update_layer_number(self, n_layers: int) -> None:
         """
         Update the number of layers in the canopy.
@@ -122,7 +427,7 @@ class Canopy:
         Args:
             n_layers: Desired number of layers
         """
-        current_layers = len(self.layers)
+        current_layers = self.nlayers
         
         if n_layers > current_layers:
             # Add new layers
@@ -132,8 +437,10 @@ class Canopy:
                     temperature=300.0
                 ))
         elif n_layers < current_layers:
-            # Remove layers from the top
-            self.layers = self.layers[:n_layers]
+            # Remove layers from the top, keeping the buffer for later growth
+            self._set_nlayers(n_layers)
+            self._dielectric_constants = self._dielectric_constants[:n_layers]
+            self._invalidate_heights()
     
     def __add__(self, other: 'Canopy') -> 'Canopy':
         """
@@ -145,18 +452,14 @@ class Canopy:
         
         Args:
             other: Another Canopy object to stack on top
-            
+        
         Returns:
             A new Canopy object combining both canopies
         """
-        # Create a deep copy of this canopy
-        new_canopy = deepcopy(self)
-        
-        # Add layers from the other canopy
-        for layer in other.layers:
-            new_canopy.append_layer(deepcopy(layer))
-        
-        return new_canopy
+        return Canopy._from_table(
+            np.concatenate((self._table(), other._table()), axis=1),
+            [copy_dielectric(d) for d in self._dielectric_constants + other._dielectric_constants]
+        )
     
     def __deepcopy__(self, memo) -> 'Canopy':
         """
@@ -167,39 +470,58 @@ class Canopy:
         
         Args:
             memo: Dictionary used by deepcopy to track objects
-            
+        
         Returns:
             A deep copy of the Canopy object
         """
-        # Create a new canopy with deep copies of all components
-        return Canopy(
-            layers=[deepcopy(layer) for layer in self.layers]
+        # The per-layer arrays hold plain floats, so copying them is a full deep copy
+        new_canopy = Canopy._from_table(
+            self._table().copy(),
+            [copy_dielectric(d, memo) for d in self._dielectric_constants]
         )
-
+        memo[id(self)] = new_canopy
+        return new_canopy
+    
     def __str__(self) -> str:
         """String representation of the Canopy object."""
+        # Derive every per-layer column and aggregate once from the stored arrays
+        thicknesses = self._thickness
+        bottom = self.layer_bottom_heights
+        water, biomass = self._per_layer_masses()
+        # Plain floats, so a canopy without biomass raises ZeroDivisionError like Layer.lfmc
+        total_vwc = float(water.sum())
+        total_agb = float(biomass.sum())
+        
         info = [
             "Description: A sample canopy object",
-            f"Number of layers: {self.nlayers}",
-            f"Total LAI: {self.LAI:.2f}",
-            f"Total thickness: {self.thickness:.2f}m",
-            f"Total AGB: {self.total_agb:.2f}kg/m²",
-            f"Total VWC: {self.total_vwc:.2f}kg/m²",
-            f"Mean LFMC: {self.mean_lfmc:.2f}kg/kg",
+            f"Number of layers: {len(thicknesses)}",
+            f"Total LAI: {self._lai.sum():.2f}",
+            f"Total thickness: {thicknesses.sum():.2f}m",
+            f"Total AGB: {total_agb:.2f}kg/m²",
+            f"Total VWC: {total_vwc:.2f}kg/m²",
+            f"Mean LFMC: {total_vwc / total_agb:.2f}kg/kg",
             "\nLayer Details:"
         ]
         
-        for i, layer in enumerate(self.layers):
-            info.append(f"\nLayer {i+1}:")
-            info.append(f"  BottomHeight: {self.layer_bottom_heights[i]:.2f} m")
-            info.append(f"  Thickness: {layer.thickness:.2f} m")
-            info.append(f"  LAI: {layer.lai:.2f} m²/m²")
-            info.append(f"  Leaf Thickness: {layer.leaf_thickness:.3f} mm")
-            info.append(f"  Temperature: {layer.temperature:.2f} K")
-            info.append(f"  Water Volumetric Fraction: {layer.water_volumetric_fraction:.3f} m3/m3")
-            info.append(f"  Dry Mass Density: {layer.dry_mass_density:.3f} g/cm³")
-            info.append(f"  Layer Water Content: {layer.layer_water_content:.2f} kg/m²")
-            info.append(f"  Live Fuel Moisture Content: {layer.lfmc:.2f} kg/kg")
-            info.append(f"  Above Ground Biomass: {layer.agb:.2f} kg/m²")
-        
-        return "\n".join(info) 
\ No newline at end of file
+        table = np.column_stack((
+            bottom, thicknesses, self._lai, self._leaf_thickness,
+            self._temperature, self._wvf, self._dmd, water, biomass
+        ))
+        
+        # One formatted block per layer, fed from the rows of the table as plain floats
+        for i, (bottom, thickness, lai, leaf_thickness, temperature, wvf, dmd, lwc, agb) in enumerate(table.tolist()):
+            info.append(
+                f"\nLayer {i+1}:\n"
+                f"  BottomHeight: {bottom:.2f} m\n"
+                f"  Thickness: {thickness:.2f} m\n"
+                f"  LAI: {lai:.2f} m²/m²\n"
+                f"  Leaf Thickness: {leaf_thickness:.3f} mm\n"
+                f"  Temperature: {temperature:.2f} K\n"
+                f"  Water Volumetric Fraction: {wvf:.3f} m3/m3\n"
+                f"  Dry Mass Density: {dmd:.3f} g/cm³\n"
+                f"  Layer Water Content: {lwc:.2f} kg/m²\n"
+                f"  Live Fuel Moisture Content: {lwc / agb:.2f} kg/kg\n"
+                f"  Above Ground Biomass: {agb:.2f} kg/m²"
+            )
+        
+        return "\n".join(info)
@@ -4,12 +4,64 @@ This module defines the Layer class which represents a single layer in the canop
 """
 
 import warnings
-from typing import Optional
+from copy import deepcopy
+from typing import Optional, Tuple
+import numpy as np
 from .constants import *
 
+
+def leaf_masses(water_volumetric_fraction, dry_mass_density, lai, leaf_thickness) -> Tuple:
+    """Leaf water content and dry biomass per unit area in kg/m², for scalars or per-layer arrays"""
+    #  Mw=Vw * rho_w * LAI * Ld 
+    #  g/m2 = m3/m3 * kg/m3 * m2/m2 * mm * 1e-3 m/mm    
+    water = water_volumetric_fraction * WATER_DENSITY_KG_M3 * lai * leaf_thickness * MM_TO_M
+    # Md=(1-Vw) * rho_d * LAI * Ld
+    # kg/m2 = (1-m3/m3) * kg/m3 * m2/m2 * mm * 1e-3 m/mm    
+    biomass = (ONE - water_volumetric_fraction) * dry_mass_density * THOUSAND * lai * leaf_thickness * MM_TO_M
+    return water, biomass
+
+
+def check_layer_ranges(thickness, lai, water_volumetric_fraction) -> None:
+    """
+    Validate layer parameters against their physical ranges.
+    
+    Accepts scalars or per-layer arrays, so a whole canopy is checked with one
+    vectorized comparison per parameter instead of one Python branch per layer.
+    
+    Raises:
+        ValueError: If any value is outside its allowed range
+    """
+    thickness = np.asarray(thickness)
+    lai = np.asarray(lai)
+    water_volumetric_fraction = np.asarray(water_volumetric_fraction)
+    if np.any((thickness < MIN_LAYER_THICKNESS) | (thickness > MAX_LAYER_THICKNESS)):
+        raise ValueError(f"Layer thickness must be between {MIN_LAYER_THICKNESS} and {MAX_LAYER_THICKNESS} meters")
+    if np.any((lai < MIN_LAI) | (lai > MAX_LAI)):
+        raise ValueError(f"Leaf area index must be between {MIN_LAI} and {MAX_LAI}")
+    if np.any((water_volumetric_fraction < ZERO) | (water_volumetric_fraction > ONE)):
+        raise ValueError(f"Water volumetric fraction must be between {ZERO} and {ONE}")
+
+
+def copy_dielectric(dielectric_constant, memo: Optional[dict] = None):
+    """Independent copy of a dielectric constant
+    
+    Scalars and None are immutable and shared, arrays are copied directly and
+    anything else, e.g. a list of per-frequency values, goes through deepcopy.
+    """
+    if dielectric_constant is None or isinstance(dielectric_constant, (int, float, complex, np.number)):
+        return dielectric_constant
+    if isinstance(dielectric_constant, np.ndarray):
+        return dielectric_constant.copy()
+    return deepcopy(dielectric_constant, memo)
+
+
 class Layer:
     """A single layer in the vegetation canopy."""
     
+    # No '__dict__' here; make_layer(properties=...) returns a subclass that has one
+    __slots__ = ('thickness', 'temperature', 'leaf_thickness', 'water_volumetric_fraction',
+                 'lai', 'dry_mass_density', 'dielectric_constant')
+    
     def __init__(self, 
                  thickness: float,
                  temperature: float,
@@ -28,7 +80,7 @@ class Layer:
             water_volumetric_fraction: Leaf Volumetric Moisture Content (m3/m3)
             lai: Leaf Area Index (m²/m²)
             dry_mass_density: Dry density of the solid material (g/cm³). Defaults to 0.3.
-            dielectric_constant: Complex dielectric constant
+            dielectric_constant: Complex dielectric constant, scalar or per-frequency array
         """
         # Validate input parameters
         if thickness < MIN_LAYER_THICKNESS or thickness > MAX_LAYER_THICKNESS:
@@ -46,25 +98,61 @@ class Layer:
         self.dry_mass_density = dry_mass_density
         self.dielectric_constant = dielectric_constant
     
+    def __deepcopy__(self, memo) -> 'Layer':
+        """
+        Create a deep copy of the layer.
+        
+        Note:
+            Scalar parameters are immutable and shared with the copy; an array
+            dielectric constant is copied directly instead of through deepcopy,
+            which is still used for other mutable values such as lists and for
+            anything a subclass adds, in its __slots__ or its __dict__.
+        
+        Args:
+            memo: Dictionary used by deepcopy to track objects
+        
+        Returns:
+            A deep copy of the Layer object
+        """
+        layer = type(self).__new__(type(self))
+        memo[id(self)] = layer
+        for name in ('thickness', 'temperature', 'leaf_thickness', 'water_volumetric_fraction',
+                     'lai', 'dry_mass_density'):
+            setattr(layer, name, getattr(self, name))
+        layer.dielectric_constant = copy_dielectric(self.dielectric_constant, memo)
+        # Slots and __dict__ entries added by subclasses go through the regular deepcopy
+        for cls in type(self).__mro__:
+            if cls is Layer:
+                continue
+            slots = cls.__dict__.get('__slots__', ())
+            for name in (slots,) if isinstance(slots, str) else slots:
+                if name in ('__dict__', '__weakref__'):
+                    continue
+                if name.startswith('__') and not name.endswith('__'):
+                    name = f"_{cls.__name__.lstrip('_')}{name}"
+                if hasattr(self, name):
+                    setattr(layer, name, deepcopy(getattr(self, name), memo))
+        extra = getattr(self, '__dict__', None)
+        if extra:
+            layer.__dict__.update(deepcopy(extra, memo))
+        return layer
+    
     @property
     def layer_water_content(self) -> float:
         """Water content of the layer per unit area, in kg/m²"""
-        #  Mw=Vw * rho_w * LAI * Ld 
-        #  g/m2 = m3/m3 * kg/m3 * m2/m2 * mm * 1e-3 m/mm    
-        return self.water_volumetric_fraction* WATER_DENSITY_KG_M3 * self.lai * self.leaf_thickness * MM_TO_M
+        return leaf_masses(self.water_volumetric_fraction, self.dry_mass_density, self.lai, self.leaf_thickness)[0]
     
     @property
     def lfmc(self) -> float:
         """Live fuel moisture content, in kg/kg"""
         # LFMC = Mw / Md 
-        return self.layer_water_content / self.agb   
+        water, biomass = leaf_masses(self.water_volumetric_fraction, self.dry_mass_density, self.lai, self.leaf_thickness)
+        return water / biomass
     
     @property
     def agb(self) -> float:
         """Above ground biomass, in kg/m²"""
-        # Md=(1-Vw) * rho_d * LAI * Ld
-        # kg/m2 = (1-m3/m3) * kg/m3 * m2/m2 * mm * 1e-3 m/mm    
-        return (ONE - self.water_volumetric_fraction)*self.dry_mass_density * THOUSAND * self.lai * self.leaf_thickness * MM_TO_M
+        return leaf_masses(self.water_volumetric_fraction, self.dry_mass_density, self.lai, self.leaf_thickness)[1]
     
     def __str__(self):
         """String representation of the Layer object."""
@@ -9,6 +9,11 @@ from ..core.layer import Layer
 from ..core.canopy import Canopy
 from ..core.constants import *
 
+class _LayerWithProperties(Layer):
+    """Layer that also holds the additional properties given to make_layer."""
+    
+    __slots__ = ('__dict__',)
+
 def make_layer(
     thickness: float,
     temperature: float,
@@ -35,7 +40,9 @@ def make_layer(
     Returns:
         Layer: A canopy layer object
     """
-    layer = Layer(
+    # Plain Layer objects have no __dict__, so extra properties need the subclass
+    layer_class = _LayerWithProperties if properties else Layer
+    layer = layer_class(
         thickness=thickness,
         temperature=temperature,
         leaf_thickness=leaf_thickness,
@@ -75,37 +82,17 @@ def make_canopy(
     Returns:
         Canopy: A canopy object with the specified layers
     """
-    n_layers = len(thicknesses)
-    
-    # Validate input arrays have the same length
-    if len(temperatures) != n_layers:
-        raise ValueError("temperatures must have the same length as thicknesses")
-    if leaf_thicknesses is not None and len(leaf_thicknesses) != n_layers:
-        raise ValueError("leaf_thicknesses must have the same length as thicknesses")
-    if water_volumetric_fractions is not None and len(water_volumetric_fractions) != n_layers:
-        raise ValueError("water_volumetric_fractions must have the same length as thicknesses")
-    if lais is not None and len(lais) != n_layers:
-        raise ValueError("lais must have the same length as thicknesses")
-    if dry_mass_densities is not None and len(dry_mass_densities) != n_layers:
-        raise ValueError("dry_mass_densities must have the same length as thicknesses")
-    if dielectric_constants is not None and len(dielectric_constants) != n_layers:
-        raise ValueError("dielectric_constants must have the same length as thicknesses")
-    
-    # Create layers
-    layers = []
-    for i in range(n_layers):
-        layer = make_layer(
-            thickness=thicknesses[i],
-            temperature=temperatures[i],
-            leaf_thickness=leaf_thicknesses[i] if leaf_thicknesses is not None else 0.2,
-            water_volumetric_fraction=water_volumetric_fractions[i] if water_volumetric_fractions is not None else 0.5,
-            lai=lais[i] if lais is not None else 1.0,
-            dry_mass_density=dry_mass_densities[i] if dry_mass_densities is not None else 0.3,
-            dielectric_constant=dielectric_constants[i] if dielectric_constants is not None else None
-        )
-        layers.append(layer)
-    
-    return Canopy(layers=layers)
+    # Arrays are validated and stored directly, no Layer objects are built;
+    # scalar defaults are filled in by from_arrays
+    return Canopy.from_arrays(
+        thicknesses=thicknesses,
+        temperatures=temperatures,
+        leaf_thicknesses=leaf_thicknesses if leaf_thicknesses is not None else 0.2,
+        water_volumetric_fractions=water_volumetric_fractions if water_volumetric_fractions is not None else 0.5,
+        lais=lais if lais is not None else 1.0,
+        dry_mass_densities=dry_mass_densities if dry_mass_densities is not None else 0.3,
+        dielectric_constants=dielectric_constants
+    )
 
 def create_uniform_canopy(
     n_layers: int,
@@ -131,19 +118,12 @@ def create_uniform_canopy(
     Returns:
         Canopy: A canopy with uniform layer properties
     """
-    # Create uniform arrays
-    thicknesses = [total_thickness / n_layers] * n_layers
-    temperatures = [temperature] * n_layers
-    leaf_thicknesses = [leaf_thickness] * n_layers
-    water_volumetric_fractions = [water_volumetric_fraction] * n_layers
-    lais = [total_lai / n_layers] * n_layers
-    dry_mass_densities = [dry_mass_density] * n_layers
-    
-    return make_canopy(
-        thicknesses=thicknesses,
-        temperatures=temperatures,
-        leaf_thicknesses=leaf_thicknesses,
-        water_volumetric_fractions=water_volumetric_fractions,
-        lais=lais,
-        dry_mass_densities=dry_mass_densities
-    ) 
\ No newline at end of file
+    # Scalar parameters are filled across all layers by from_arrays
+    return Canopy.from_arrays(
+        thicknesses=np.full(n_layers, total_thickness / n_layers),
+        temperatures=temperature,
+        leaf_thicknesses=leaf_thickness,
+        water_volumetric_fractions=water_volumetric_fraction,
+        lais=total_lai / n_layers,
+        dry_mass_densities=dry_mass_density
+    )